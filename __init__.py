@@ -38,6 +38,7 @@ from sverchok_extra.utils import show_welcome
 
 def nodes_index():
     return [("Extra Surfaces", [
+                ("surface.evaluate_surface", "SvExEvalSurfaceNode"),
                 ("surface.smooth_spline", "SvExBivariateSplineNode"),
                 ("surface.curvature_lines", "SvExSurfaceCurvatureLinesNode"),
                 ("surface.implicit_surface_solver", "SvExImplSurfaceSolverNode"),
@@ -33,3 +33,13 @@ except ImportError:
     info(pygalmesh_d.message)
     pygalmesh = None
 
+numba_d = ex_dependencies["numba"] = SvDependency("numba", "https://numba.pydata.org/")
+try:
+    import numba
+    numba_d.message = "Numba package is available"
+    numba_d.module = numba
+except ImportError:
+    numba_d.message = "Numba package is not available. Some nodes will fall back to slower implementations"
+    info(numba_d.message)
+    numba = None
+
@@ -0,0 +1,388 @@
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+import bpy
+from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty
+
+import sverchok
+from sverchok.node_tree import SverchCustomTreeNode
+from sverchok.data_structure import updateNode, zip_long_repeat
+from sverchok.utils.surface import SvSurface
+
+from sverchok_extra.dependencies import numba
+
+U_SOCKET = 1
+V_SOCKET = 2
+
+# Column permutations for surfaces defined in a non-default orientation
+_PERM = {
+        'X': [2, 0, 1],
+        'Y': [1, 2, 0],
+        'Z': [0, 1, 2]
+    }
+
+# For very large grids, tight Numba loops writing into preallocated
+# arrays beat the NumPy versions by skipping the stack/concatenate
+# temporaries; they are used when Numba is available.
+NUMBA_THRESHOLD = 10000
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _make_edges_xy_numba(samples_u, samples_v):
+        n = samples_v * (samples_u - 1) + (samples_v - 1) * samples_u
+        edges = np.empty((n, 2), dtype=np.int32)
+        k = 0
+        for row in range(samples_v):
+            base = row * samples_u
+            for i in range(samples_u - 1):
+                edges[k,0] = base + i
+                edges[k,1] = base + i + 1
+                k += 1
+        for row in range(samples_v - 1):
+            base = row * samples_u
+            for j in range(samples_u):
+                edges[k,0] = base + j
+                edges[k,1] = base + j + samples_u
+                k += 1
+        return edges
+
+    @numba.njit(cache=True)
+    def _make_faces_xy_numba(samples_u, samples_v):
+        n = (samples_v - 1) * (samples_u - 1)
+        faces = np.empty((n, 4), dtype=np.int32)
+        k = 0
+        for row in range(samples_v - 1):
+            for col in range(samples_u - 1):
+                i = row * samples_u + col
+                faces[k,0] = i
+                faces[k,1] = i + samples_u
+                faces[k,2] = i + samples_u + 1
+                faces[k,3] = i + 1
+                k += 1
+        return faces
+
+# The grid topology depends only on the sample counts, which rarely change
+# between interactive updates, so cache the built lists.
+
+@lru_cache(maxsize=32)
+def make_edges_xy(samples_u, samples_v):
+    if numba is not None and samples_u * samples_v > NUMBA_THRESHOLD:
+        return _make_edges_xy_numba(samples_u, samples_v).tolist()
+    i = np.arange(samples_u - 1)
+    rows = np.arange(samples_v)[:,None] * samples_u
+    h_edges = np.stack([i + rows, i + 1 + rows], axis=-1).reshape(-1, 2)
+    j = np.arange(samples_u)
+    rows = np.arange(samples_v - 1)[:,None] * samples_u
+    v_edges = np.stack([j + rows, j + rows + samples_u], axis=-1).reshape(-1, 2)
+    return np.concatenate([h_edges, v_edges], axis=0).tolist()
+
+@lru_cache(maxsize=32)
+def make_faces_xy(samples_u, samples_v):
+    if numba is not None and samples_u * samples_v > NUMBA_THRESHOLD:
+        return _make_faces_xy_numba(samples_u, samples_v).tolist()
+    rows = np.arange(samples_v - 1)[:,None]
+    cols = np.arange(samples_u - 1)[None,:]
+    i = rows * samples_u + cols
+    faces = np.stack([i, i + samples_u, i + samples_u + 1, i + 1], axis=-1)
+    return faces.reshape(-1, 4).tolist()
+
+class SvExEvalSurfaceNode(bpy.types.Node, SverchCustomTreeNode):
+    """
+    Triggers: Evaluate Surface
+    Tooltip: Evaluate the surface in the provided U/V coordinates
+    """
+    bl_idname = 'SvExEvalSurfaceNode'
+    bl_label = 'Evaluate Surface'
+    bl_icon = 'OUTLINER_OB_EMPTY'
+    sv_icon = 'SV_EVAL_SURFACE'
+
+    def update_sockets(self, context):
+        # unpack the socket collections once instead of a by-name lookup
+        # per socket
+        _, u_in, v_in, verts_in, samples_u_in, samples_v_in = self.inputs
+        _, edges_out, faces_out = self.outputs
+        u_in.hide_safe = self.eval_mode == 'GRID' or self.input_mode == 'VERTICES'
+        v_in.hide_safe = self.eval_mode == 'GRID' or self.input_mode == 'VERTICES'
+        verts_in.hide_safe = self.eval_mode == 'GRID' or self.input_mode == 'PAIRS'
+        samples_u_in.hide_safe = self.eval_mode != 'GRID'
+        samples_v_in.hide_safe = self.eval_mode != 'GRID'
+        edges_out.hide_safe = self.eval_mode != 'GRID'
+        faces_out.hide_safe = self.eval_mode != 'GRID'
+        updateNode(self, context)
+
+    eval_modes = [
+        ('GRID', "Grid", "Evaluate the surface on a regular grid of points", 0),
+        ('EXPLICIT', "Explicit", "Evaluate the surface in the specified points", 1)
+    ]
+
+    eval_mode : EnumProperty(
+            name = "Mode",
+            items = eval_modes,
+            default = 'GRID',
+            update = update_sockets)
+
+    input_modes = [
+        ('PAIRS', "Separate", "Separate U V (or X Y) sockets", 0),
+        ('VERTICES', "Vertices", "Single socket for vertices", 1)
+    ]
+
+    input_mode : EnumProperty(
+            name = "Input mode",
+            items = input_modes,
+            default = 'PAIRS',
+            update = update_sockets)
+
+    axes = [
+        ('XY', "X Y", "XOY plane", 0),
+        ('YZ', "Y Z", "YOZ plane", 1),
+        ('XZ', "X Z", "XOZ plane", 2)
+    ]
+
+    orientation : EnumProperty(
+            name = "Orientation",
+            items = axes,
+            default = 'XY',
+            update = updateNode)
+
+    samples_u : IntProperty(
+            name = "Samples U",
+            default = 25, min = 3,
+            update = updateNode)
+
+    samples_v : IntProperty(
+            name = "Samples V",
+            default = 25, min = 3,
+            update = updateNode)
+
+    output_numpy : BoolProperty(
+            name = "Output NumPy",
+            description = "Output vertices as NumPy arrays; faster, for nodes which can consume them",
+            default = False,
+            update = updateNode)
+
+    def sv_init(self, context):
+        self.inputs.new('SvSurfaceSocket', "Surface")
+        self.inputs.new('SvStringsSocket', "U") # U_SOCKET
+        self.inputs.new('SvStringsSocket', "V") # V_SOCKET
+        self.inputs.new('SvVerticesSocket', "Vertices")
+        self.inputs.new('SvStringsSocket', "SamplesU").prop_name = 'samples_u'
+        self.inputs.new('SvStringsSocket', "SamplesV").prop_name = 'samples_v'
+        self.outputs.new('SvVerticesSocket', "Vertices")
+        self.outputs.new('SvStringsSocket', "Edges")
+        self.outputs.new('SvStringsSocket', "Faces")
+        self.update_sockets(context)
+
+    def draw_buttons(self, context, layout):
+        layout.label(text="Evaluate:")
+        layout.prop(self, 'eval_mode', expand=True)
+        if self.eval_mode == 'EXPLICIT':
+            layout.label(text="Input mode:")
+            layout.prop(self, 'input_mode', expand=True)
+            if self.input_mode == 'VERTICES':
+                layout.label(text="Input orientation:")
+                layout.prop(self, 'orientation', expand=True)
+
+    def draw_buttons_ext(self, context, layout):
+        self.draw_buttons(context, layout)
+        layout.prop(self, 'output_numpy')
+
+    def parse_input(self, verts):
+        # asarray is a no-op when the socket already carries a float32 array
+        verts = np.asarray(verts, dtype=np.float32)
+        if verts.ndim != 2 or verts.shape[-1] != 3:
+            verts = verts.reshape(-1, 3)
+        if self.orientation == 'XY':
+            us, vs = verts[:,0], verts[:,1]
+        elif self.orientation == 'YZ':
+            us, vs = verts[:,1], verts[:,2]
+        else: # XZ
+            us, vs = verts[:,0], verts[:,2]
+        # pack the stride-3 column views into contiguous 1-D arrays, so
+        # everything downstream works on stride-1 data
+        return np.ascontiguousarray(us), np.ascontiguousarray(vs)
+
+    def build_output(self, surface, verts):
+        if not surface.has_input_matrix:
+            # the most common case: nothing to permute or transform
+            return verts
+        matrix = surface.get_input_matrix()
+        np_matrix = np.asarray(matrix.to_3x3(), dtype=verts.dtype)
+        # M @ (v - t) == v @ M.T - t @ M.T; precomputing the offset
+        # saves a separate pass over the whole vertex array. The offset
+        # uses the unpermuted matrix, since the translation applies
+        # after the axis permutation.
+        offset = np.asarray(matrix.translation, dtype=verts.dtype) @ np_matrix.T
+        orientation = surface.get_input_orientation()
+        if orientation != 'Z':
+            # fold the axis permutation into the matrix, so one matmul
+            # applies both
+            np_matrix = np_matrix @ np.eye(3, dtype=verts.dtype)[_PERM[orientation]]
+        verts = verts @ np_matrix.T
+        verts -= offset
+        return verts
+
+    def evaluate_isoline(self, surface, samples_u, samples_v):
+        # A degenerate grid (one sample along U or V) is just an isoline
+        # of the surface. Surface implementations may provide dedicated
+        # isoline evaluation, which can skip a whole dimension of basis
+        # calculations; use it when available. Returns None when the
+        # surface has no such support.
+        if samples_u == 1 and hasattr(surface, 'evaluate_isoline_u'):
+            u0 = surface.get_u_min()
+            vs = np.linspace(surface.get_v_min(), surface.get_v_max(), num=samples_v, dtype=np.float32)
+            return surface.evaluate_isoline_u(u0, vs)
+        if samples_v == 1 and hasattr(surface, 'evaluate_isoline_v'):
+            v0 = surface.get_v_min()
+            us = np.linspace(surface.get_u_min(), surface.get_u_max(), num=samples_u, dtype=np.float32)
+            return surface.evaluate_isoline_v(v0, us)
+        return None
+
+    def make_grid_ranges(self, surface, samples_u, samples_v):
+        u_min = surface.get_u_min()
+        u_max = surface.get_u_max()
+        v_min = surface.get_v_min()
+        v_max = surface.get_v_max()
+        us = np.linspace(u_min, u_max, num=samples_u, dtype=np.float32)
+        vs = np.linspace(v_min, v_max, num=samples_v, dtype=np.float32)
+        return us, vs
+
+    def make_grid_input(self, surface, samples_u, samples_v):
+        us, vs = self.make_grid_ranges(surface, samples_u, samples_v)
+        # same result as flattening a meshgrid, without materializing
+        # two (samples_v, samples_u) arrays first
+        us = np.tile(us, samples_v)
+        vs = np.repeat(vs, samples_u)
+        return us, vs
+
+    def process(self):
+        outputs = list(self.outputs)
+        if not any(socket.is_linked for socket in outputs):
+            return
+        vertices_out_socket, edges_out_socket, faces_out_socket = outputs
+        surface_in, u_in, v_in, verts_in, samples_u_in, samples_v_in = self.inputs
+
+        surfaces_s = surface_in.sv_get()
+        target_us_s = u_in.sv_get(default=[[]])
+        target_vs_s = v_in.sv_get(default=[[]])
+        target_verts_s = verts_in.sv_get(default=[[]])
+        samples_u_s = samples_u_in.sv_get()
+        samples_v_s = samples_v_in.sv_get()
+
+        if isinstance(surfaces_s[0], (list, tuple)):
+            surfaces_s = sum(surfaces_s, [])
+
+        inputs = zip_long_repeat(surfaces_s, target_us_s, target_vs_s, target_verts_s, samples_u_s, samples_v_s)
+        jobs = []
+        for surface, target_us, target_vs, target_verts, samples_u, samples_v in inputs:
+            if isinstance(samples_u, (list, tuple)):
+                samples_u = samples_u[0]
+            if isinstance(samples_v, (list, tuple)):
+                samples_v = samples_v[0]
+
+            pre_verts = None
+            if self.eval_mode == 'GRID':
+                if samples_u == 1 or samples_v == 1:
+                    pre_verts = self.evaluate_isoline(surface, samples_u, samples_v)
+                if pre_verts is None and hasattr(surface, 'evaluate_grid'):
+                    # tensor-product surfaces can evaluate a whole grid
+                    # from the 1-D parameter ranges with O(N+M) basis
+                    # calculations instead of O(N*M); expected result
+                    # shape is (samples_v, samples_u, 3)
+                    us_range, vs_range = self.make_grid_ranges(surface, samples_u, samples_v)
+                    pre_verts = np.asarray(surface.evaluate_grid(us_range, vs_range)).reshape(-1, 3)
+                if pre_verts is None:
+                    target_us, target_vs = self.make_grid_input(surface, samples_u, samples_v)
+                else:
+                    target_us = target_vs = None
+                new_edges = make_edges_xy(samples_u, samples_v)
+                new_faces = make_faces_xy(samples_u, samples_v)
+            else:
+                if self.input_mode == 'VERTICES':
+                    target_us, target_vs = self.parse_input(target_verts)
+                else:
+                    target_us = np.asarray(target_us, dtype=np.float32)
+                    target_vs = np.asarray(target_vs, dtype=np.float32)
+                new_edges = []
+                new_faces = []
+
+            jobs.append((surface, target_us, target_vs, new_edges, new_faces, pre_verts))
+
+        # The output length is known up front, so preallocate the output
+        # lists and index-assign into them.
+        n_jobs = len(jobs)
+        verts_out = [None] * n_jobs
+        edges_out = [None] * n_jobs
+        faces_out = [None] * n_jobs
+
+        # When the same surface is zipped against several parameter lists,
+        # evaluate it once on the concatenated parameters and split the
+        # result back, instead of paying the evaluator call overhead per
+        # input row.
+        groups = []
+        idx = 0
+        while idx < len(jobs):
+            surface = jobs[idx][0]
+            group_end = idx + 1
+            while group_end < len(jobs) and jobs[group_end][0] is surface \
+                    and jobs[idx][5] is None and jobs[group_end][5] is None:
+                group_end += 1
+            groups.append((idx, jobs[idx:group_end]))
+            idx = group_end
+
+        def eval_group(args):
+            start, group = args
+            surface = group[0][0]
+            if group[0][5] is not None:
+                results = [group[0][5]]
+            elif len(group) == 1:
+                # evaluators reshape their input internally; stride-1
+                # arrays keep that from triggering hidden copies
+                target_us = np.ascontiguousarray(group[0][1])
+                target_vs = np.ascontiguousarray(group[0][2])
+                results = [surface.evaluate_array(target_us, target_vs)]
+            else:
+                # np.concatenate always returns contiguous arrays
+                all_us = np.concatenate([item[1] for item in group])
+                all_vs = np.concatenate([item[2] for item in group])
+                split_indices = np.cumsum([len(item[1]) for item in group])[:-1]
+                results = np.split(surface.evaluate_array(all_us, all_vs), split_indices)
+            # when all results in the group share a shape, stack them and
+            # run the affine transform once over the (M,N,3) tensor -
+            # matmul broadcasts over the leading axis, so this is a
+            # single BLAS call instead of one per object
+            if len(results) > 1 and len(set(item.shape for item in results)) == 1:
+                results = list(self.build_output(surface, np.stack(results)))
+            else:
+                results = [self.build_output(surface, item) for item in results]
+            for k, ((_, _, _, new_edges, new_faces, _), new_verts) in enumerate(zip(group, results), start=start):
+                if not self.output_numpy:
+                    new_verts = new_verts.tolist()
+                verts_out[k] = new_verts
+                edges_out[k] = new_edges
+                faces_out[k] = new_faces
+
+        # Distinct surfaces are independent of each other; NumPy-based
+        # evaluators release the GIL, so for multi-surface inputs run the
+        # groups in a thread pool. Each group writes only its own output
+        # slots.
+        if len(groups) > 1:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                list(executor.map(eval_group, groups))
+        else:
+            for group_item in groups:
+                eval_group(group_item)
+
+        vertices_out_socket.sv_set(verts_out)
+        edges_out_socket.sv_set(edges_out)
+        faces_out_socket.sv_set(faces_out)
+
+def register():
+    bpy.utils.register_class(SvExEvalSurfaceNode)
+
+def unregister():
+    bpy.utils.unregister_class(SvExEvalSurfaceNode)